@@ -1,20 +1,84 @@
 #!/usr/bin/env python3
+import asyncio
 import os
 import json
 import re
+import shutil
+import socket
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
-from urllib.parse import urlparse  # kept in case you want it later
+from operator import itemgetter
+from urllib.parse import urlparse
 import feedparser
 
+# We clean summaries ourselves (strip_html), so
+# skip feedparser's pure-Python HTML sanitiser and the relative-URI
+# rewrite inside that HTML. Entry links are still made absolute as before.
+feedparser.SANITIZE_HTML = 0
+feedparser.RESOLVE_RELATIVE_URIS = 0
+
+# lxml builds and serialises the RSS tree in C; ElementTree is the fallback
+try:
+    from lxml import etree as ET
+    HAVE_LXML = True
+except ImportError:
+    import xml.etree.ElementTree as ET
+    HAVE_LXML = False
+
 # Optional HTML scraping (off by default to respect ToS/robots).
 # If you enable it, install: pip install requests beautifulsoup4
 USE_HTML_SCRAPING = False
 if USE_HTML_SCRAPING:
-    import requests
     from bs4 import BeautifulSoup
+    # lxml is also the faster BeautifulSoup backend
+    BS_PARSER = "lxml" if HAVE_LXML else "html.parser"
 
 CONFIG_PATH = os.environ.get("IS_CONFIG", "config.json")
 DATA_OUT = "data/news.json"
+RSS_OUT = "data/feed.xml"
+SITE_URL = "https://industrialstrategy.github.io/industrialstrategy/"
+# ETag / Last-Modified per feed, for conditional GETs on the next run,
+# plus that feed's items to reuse when it answers 304
+FEED_CACHE = "data/.feedcache.json"
+USER_AGENT = "IndustrialStrategyBot/0.1"
+# Feeds are network-bound, so fetch several at once
+FETCH_WORKERS = int(os.environ.get("IS_WORKERS", "8"))
+# Seconds; bound every fetch so one slow server can't stall the run
+FETCH_TIMEOUT = 15  # total, per feed
+FETCH_CONNECT_TIMEOUT = 5
+FETCH_READ_TIMEOUT = 10
+# The entry fields entry_to_item reads
+_ENTRY_FIELDS = (
+    "title", "summary", "description", "link",
+    "published", "updated", "published_parsed", "updated_parsed",
+)
+
+# Try to load aiohttp for concurrent feed downloads
+try:
+    import aiohttp
+    HAVE_AIOHTTP = True
+except ImportError:
+    HAVE_AIOHTTP = False
+
+# Without aiohttp, requests gives pooled connections, retries and timeouts
+try:
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+    HAVE_REQUESTS = True
+except ImportError:
+    HAVE_REQUESTS = False
+
+# Try to load orjson for faster JSON output
+try:
+    import orjson
+    HAVE_ORJSON = True
+except ImportError:
+    HAVE_ORJSON = False
+
+# Indent the JSON output (for debugging; the web app doesn't need it)
+PRETTY_JSON = bool(os.environ.get("IS_PRETTY"))
 
 # Try to load transformers for AI summaries
 try:
@@ -23,7 +87,159 @@ try:
 except ImportError:
     HAVE_TRANSFORMERS = False
 
+# Optional: run the summariser as an int8 ONNX Runtime model
+try:
+    from optimum.onnxruntime import ORTModelForSeq2SeqLM, ORTQuantizer
+    from optimum.onnxruntime.configuration import AutoQuantizationConfig
+    HAVE_OPTIMUM = True
+except ImportError:
+    HAVE_OPTIMUM = False
+
+SUMMARY_MODEL = "sshleifer/distilbart-cnn-12-6"
+# Quantized model is exported once and reused (cached between CI runs)
+QUANTIZED_MODEL_DIR = os.environ.get(
+    "IS_MODEL_CACHE",
+    os.path.join(
+        os.path.expanduser("~"), ".cache", "industrialstrategy",
+        "distilbart-cnn-12-6-int8",
+    ),
+)
+# ONNX files optimum exports for a seq2seq model, by from_pretrained kwarg
+_ONNX_PARTS = {
+    "encoder_file_name": "encoder_model",
+    "decoder_file_name": "decoder_model",
+    "decoder_with_past_file_name": "decoder_with_past_model",
+}
+# What QUANTIZED_MODEL_DIR must hold before we skip the export
+_QUANTIZED_MODEL_FILES = (
+    "config.json",
+    "tokenizer_config.json",
+    "encoder_model_quantized.onnx",
+    "decoder_model_quantized.onnx",
+)
+
+# Try to load pyahocorasick for single-pass keyword matching
+try:
+    import ahocorasick
+    HAVE_AHOCORASICK = True
+except ImportError:
+    HAVE_AHOCORASICK = False
+
+# Control characters XML 1.0 can't carry, even escaped
+_XML_INVALID_RE = re.compile("[\x00-\x08\x0b\x0c\x0e-\x1f]")
+
+# A tag can't contain "<", so a stray unclosed "<" fails at the next one
+# instead of rescanning to the end of the string: linear in the input
+_HTML_TAG_RE = re.compile(r"<[^<>]*>")
+# Elements whose content is code, not text; dropped whole before the
+# tags are stripped (feedparser's sanitiser did this before we
+# turned it off). strip_html pairs each opening tag with its close.
+_HTML_BLOCK_OPEN_RE = re.compile(r"<(script|style|iframe|noscript)\b", re.I)
+_HTML_BLOCK_CLOSE_RE = re.compile(r"</(script|style|iframe|noscript)\s*>", re.I)
+
+# Substring -> tag label for infer_ai_tags
+_AI_TAG_MAP = {
+    "hydrogen": "Hydrogen",
+    "fuel cell": "Fuel cells",
+    "net zero": "Net zero",
+    "decarbonis": "Decarbonisation",
+    "industrial strategy": "Industrial strategy",
+    "manufactur": "Manufacturing",
+    "supply chain": "Supply chains",
+    "semiconductor": "Semiconductors",
+    "chips act": "CHIPS / semiconductors",
+    "ira ": "US IRA",
+    "r&d": "R&D",
+    "research and development": "R&D",
+    "innovation": "Innovation",
+    "clean energy": "Clean energy",
+    "heat pump": "Heat pumps",
+    "nuclear": "Nuclear",
+    "small modular reactor": "SMRs",
+    "trade": "Trade",
+    "export": "Trade",
+}
+
+_TAG_AUTOMATON = None
 _SUMMARIZER = None
+SUMMARY_BATCH_SIZE = 8
+_KEYWORD_MATCHER = None
+_KEYWORD_MATCHER_FOR = None
+# Below this many keywords a plain substring test per keyword is faster
+# than walking the automaton (measured crossover is ~30)
+KEYWORD_AUTOMATON_MIN = 32
+
+
+def quantized_model_complete(model_dir: str) -> bool:
+    return all(
+        os.path.exists(os.path.join(model_dir, name))
+        for name in _QUANTIZED_MODEL_FILES
+    )
+
+
+def quantize_summary_model(save_dir: str):
+    """
+    Export SUMMARY_MODEL to ONNX and dynamically quantize it to int8.
+    Everything is written to a sibling temp directory that only replaces
+    save_dir once complete, so a failed export never leaves (or gets
+    cached as) a half-built model.
+    """
+    from transformers import AutoTokenizer
+
+    qconfig = AutoQuantizationConfig.avx512_vnni(
+        is_static=False, per_channel=False
+    )
+    parent = os.path.dirname(os.path.abspath(save_dir))
+    os.makedirs(parent, exist_ok=True)
+    build_dir = tempfile.mkdtemp(prefix=".partial-", dir=parent)
+    try:
+        with tempfile.TemporaryDirectory() as onnx_dir:
+            model = ORTModelForSeq2SeqLM.from_pretrained(
+                SUMMARY_MODEL, export=True
+            )
+            model.save_pretrained(onnx_dir)
+            for stem in _ONNX_PARTS.values():
+                if not os.path.exists(os.path.join(onnx_dir, f"{stem}.onnx")):
+                    continue
+                quantizer = ORTQuantizer.from_pretrained(
+                    onnx_dir, file_name=f"{stem}.onnx"
+                )
+                quantizer.quantize(
+                    save_dir=build_dir, quantization_config=qconfig
+                )
+            model.config.save_pretrained(build_dir)
+        AutoTokenizer.from_pretrained(SUMMARY_MODEL).save_pretrained(build_dir)
+        if not quantized_model_complete(build_dir):
+            raise RuntimeError(f"int8 export incomplete in {build_dir}")
+        # clear out any earlier, incomplete attempt before swapping in
+        shutil.rmtree(save_dir, ignore_errors=True)
+        os.replace(build_dir, save_dir)
+    except BaseException:
+        shutil.rmtree(build_dir, ignore_errors=True)
+        raise
+
+
+def load_quantized_summarizer():
+    """Summarisation pipeline backed by the cached int8 ONNX model."""
+    from transformers import AutoTokenizer
+
+    if not quantized_model_complete(QUANTIZED_MODEL_DIR):
+        print(f"[INFO] quantizing {SUMMARY_MODEL} into {QUANTIZED_MODEL_DIR}")
+        quantize_summary_model(QUANTIZED_MODEL_DIR)
+
+    file_names = {}
+    for kwarg, stem in _ONNX_PARTS.items():
+        name = f"{stem}_quantized.onnx"
+        if os.path.exists(os.path.join(QUANTIZED_MODEL_DIR, name)):
+            file_names[kwarg] = name
+    model = ORTModelForSeq2SeqLM.from_pretrained(
+        QUANTIZED_MODEL_DIR,
+        provider="CPUExecutionProvider",
+        use_cache="decoder_with_past_file_name" in file_names,
+        **file_names,
+    )
+    tokenizer = AutoTokenizer.from_pretrained(QUANTIZED_MODEL_DIR)
+    return pipeline("summarization", model=model, tokenizer=tokenizer)
 
 
 def get_summarizer():
@@ -31,11 +247,16 @@ def get_summarizer():
     global _SUMMARIZER
     if not HAVE_TRANSFORMERS:
         return None
+    if _SUMMARIZER is None and HAVE_OPTIMUM:
+        try:
+            _SUMMARIZER = load_quantized_summarizer()
+        except Exception as e:
+            print(f"[WARN] int8 summariser unavailable, using PyTorch: {e}")
     if _SUMMARIZER is None:
         # Small-ish summarisation model, fine on CPU in Actions
         _SUMMARIZER = pipeline(
             "summarization",
-            model="sshleifer/distilbart-cnn-12-6",
+            model=SUMMARY_MODEL,
         )
     return _SUMMARIZER
 
@@ -45,180 +266,558 @@ def load_config(path: str):
         return json.load(f)
 
 
+def dump_json(obj, newline: bool = True) -> bytes:
+    """Serialise obj as UTF-8 JSON, with a trailing newline by default."""
+    if HAVE_ORJSON:
+        option = orjson.OPT_APPEND_NEWLINE if newline else 0
+        if PRETTY_JSON:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option)
+    if PRETTY_JSON:
+        text = json.dumps(obj, ensure_ascii=False, indent=2)
+    else:
+        text = json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+    if newline:
+        text += "\n"
+    return text.encode("utf-8")
+
+
+def serialise_items(items: list) -> bytes:
+    """Comma-separated JSON for a run of items, to go inside an array."""
+    return b",".join(dump_json(item, newline=False) for item in items)
+
+
+def _write_run(f, sep: bytes, items: list):
+    f.write(sep + serialise_items(items))
+
+
+def stream_json(path: str, header: dict, runs):
+    """
+    Write the header object as JSON with an "items" array streamed in
+    from runs (an iterable of item lists). Each run is serialised and
+    written on a writer thread while the next one is being produced,
+    so the encoded output is never held in memory as a whole. Replaces
+    path only once everything is written, like write_atomic.
+    """
+    tmp = f"{path}.tmp"
+    head = dump_json(header, newline=False)
+    pending = []
+    try:
+        with open(tmp, "wb") as f, \
+                ThreadPoolExecutor(max_workers=1) as writer:
+            f.write(head[:-1] + b',"items":[')
+            sep = b""
+            for run in runs:
+                pending.append(writer.submit(_write_run, f, sep, run))
+                sep = b","
+            pending.append(writer.submit(f.write, b"]}\n"))
+        for fut in pending:
+            fut.result()  # re-raise any write error before replacing path
+    except BaseException:
+        # don't leave the partial file behind
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+        raise
+    os.replace(tmp, path)
+
+
+def write_atomic(path: str, data: bytes):
+    """Write via a temp file so readers never see a half-written file."""
+    tmp = f"{path}.tmp"
+    with open(tmp, "wb") as f:
+        f.write(data)
+    os.replace(tmp, path)
+
+
 def norm(s: str) -> str:
     return (s or "").lower()
 
 
-def matches_keywords(text: str, keywords: list) -> list:
-    """Return list of keywords that match this text."""
-    t = norm(text)
-    matched = []
+def item_text_lower(title: str, summary: str) -> str:
+    """Lowercased title + summary, computed once per item for matching."""
+    return norm(f"{title} {summary}")
+
+
+def keyword_needles(keywords: list) -> list:
+    """Return (lowercase search text, display keyword) for each keyword."""
+    needles = []
     for kw in keywords:
         kw_clean = kw.strip()
         if not kw_clean:
             continue
         if kw_clean.startswith('"') and kw_clean.endswith('"'):
-            phrase = kw_clean[1:-1].lower()
-            if phrase in t:
-                matched.append(kw_clean)
+            needles.append((kw_clean[1:-1].lower(), kw_clean))
         else:
-            if kw_clean.lower() in t:
-                matched.append(kw_clean)
-    return matched
+            needles.append((kw_clean.lower(), kw_clean))
+    return needles
+
 
+def get_keyword_matcher(keywords: list):
+    """
+    Lazy init for the normalised keyword list plus, for long lists when
+    pyahocorasick is available, an Aho-Corasick automaton over it.
+    Rebuilt only if the keywords change.
+    """
+    global _KEYWORD_MATCHER, _KEYWORD_MATCHER_FOR
+    key = tuple(keywords)
+    if _KEYWORD_MATCHER_FOR != key:
+        needles = keyword_needles(keywords)
+        automaton = None
+        always = ()
+        if HAVE_AHOCORASICK and len(needles) >= KEYWORD_AUTOMATON_MIN:
+            positions = {}
+            for idx, (needle, _) in enumerate(needles):
+                positions.setdefault(needle, []).append(idx)
+            # an empty phrase ('""') is a substring of everything
+            always = tuple(positions.pop("", ()))
+            if positions:
+                automaton = ahocorasick.Automaton()
+                for needle, idxs in positions.items():
+                    automaton.add_word(needle, tuple(idxs))
+                automaton.make_automaton()
+        _KEYWORD_MATCHER = (needles, automaton, always)
+        _KEYWORD_MATCHER_FOR = key
+    return _KEYWORD_MATCHER
+
+
+def matches_keywords(t: str, keywords: list) -> list:
+    """Return list of keywords that match this (already lowercased) text."""
+    needles, automaton, always = get_keyword_matcher(keywords)
+    if automaton is None:
+        return [kw_clean for needle, kw_clean in needles if needle in t]
+
+    hits = set(always)
+    for _, idxs in automaton.iter(t):
+        hits.update(idxs)
+    # keep config order, as the plain loop does
+    return [needles[idx][1] for idx in sorted(hits)]
+
+
+def load_feed_cache() -> dict:
+    try:
+        with open(FEED_CACHE, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def cached_item(item: dict) -> dict:
+    """
+    A feed's item as kept in FEED_CACHE: without its "src" index, which
+    only means something against one run's "sources" list, or "_lower"
+    (still set on items dedupe dropped).
+    """
+    return {k: v for k, v in item.items() if k not in ("src", "_lower")}
 
-def fetch_feed(url: str):
+
+def fetch_feed(url: str, validators: dict = None):
+    validators = validators or {}
     try:
-        return feedparser.parse(url)
+        return feedparser.parse(
+            url,
+            etag=validators.get("etag"),
+            modified=validators.get("modified"),
+        )
     except Exception as e:
         print(f"[WARN] feed error {url}: {e}")
         return {"entries": []}
 
 
-def entry_to_item(entry, source_url: str, keywords: list):
+def parse_feed(url: str, body: bytes, headers: dict) -> dict:
+    """
+    Parse a downloaded feed, keeping only the entry fields we use so
+    the parsed trees can be freed as soon as each feed is done.
+    """
+    try:
+        feed = feedparser.parse(body, response_headers=headers)
+    except Exception as e:
+        print(f"[WARN] feed error {url}: {e}")
+        return {"entries": []}
+    return {
+        "entries": [
+            {k: entry.get(k) for k in _ENTRY_FIELDS}
+            for entry in feed.get("entries", [])
+        ],
+        # feedparser only fills these in when it does the HTTP itself
+        "etag": headers.get("etag"),
+        "modified": headers.get("last-modified"),
+    }
+
+
+def _conditional_headers(validators: dict) -> dict:
+    request_headers = {}
+    if validators.get("etag"):
+        request_headers["If-None-Match"] = validators["etag"]
+    if validators.get("modified"):
+        request_headers["If-Modified-Since"] = validators["modified"]
+    return request_headers
+
+
+def make_session():
+    """requests session with a shared connection pool and light retries."""
+    session = requests.Session()
+    session.headers["User-Agent"] = USER_AGENT
+    adapter = HTTPAdapter(
+        pool_connections=32,
+        pool_maxsize=max(FETCH_WORKERS, 1),
+        max_retries=Retry(
+            total=2,
+            backoff_factor=0.5,
+            status_forcelist=(500, 502, 503, 504),
+        ),
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def _fetch_sync(session, url: str, validators: dict):
+    """Blocking counterpart of _fetch; errors are returned, not raised."""
+    try:
+        r = session.get(
+            url,
+            headers=_conditional_headers(validators),
+            timeout=(FETCH_CONNECT_TIMEOUT, FETCH_READ_TIMEOUT),
+        )
+        if r.status_code == 304:
+            return None, {}
+        r.raise_for_status()
+        headers = {k.lower(): v for k, v in r.headers.items()}
+        headers.setdefault("content-location", r.url)
+        return r.content, headers
+    except Exception as e:
+        return e
+
+
+async def _fetch(session, url: str, validators: dict):
+    request_headers = _conditional_headers(validators)
+    async with session.get(url, headers=request_headers) as r:
+        if r.status == 304:
+            return None, {}
+        r.raise_for_status()
+        headers = {k.lower(): v for k, v in r.headers.items()}
+        # lets feedparser resolve relative links against the feed URL
+        headers.setdefault("content-location", str(r.url))
+        return await r.read(), headers
+
+
+async def _fetch_all(urls: list, validators: dict):
+    connector = aiohttp.TCPConnector(limit=50)
+    async with aiohttp.ClientSession(
+        connector=connector,
+        headers={"User-Agent": USER_AGENT},
+        timeout=aiohttp.ClientTimeout(
+            total=FETCH_TIMEOUT,
+            sock_connect=FETCH_CONNECT_TIMEOUT,
+            sock_read=FETCH_READ_TIMEOUT,
+        ),
+    ) as session:
+        return await asyncio.gather(
+            *[_fetch(session, url, validators.get(url, {})) for url in urls],
+            return_exceptions=True,
+        )
+
+
+def fetch_feeds(urls: list, validators: dict = None) -> list:
+    """
+    Fetch and parse every feed, returned in the same order as urls.
+    With aiohttp the downloads all run on one event loop, otherwise on
+    a thread pool sharing one requests session; either way the bodies
+    are then parsed one at a time. With neither, feedparser fetches
+    each URL itself on the thread pool.
+    validators maps url -> {"etag", "modified"} from the previous run;
+    an unchanged feed comes back as {"status": 304, "entries": []}.
+    """
+    validators = validators or {}
+    if HAVE_AIOHTTP:
+        results = asyncio.run(_fetch_all(urls, validators))
+    elif HAVE_REQUESTS:
+        with make_session() as session, \
+                ThreadPoolExecutor(max_workers=FETCH_WORKERS) as ex:
+            results = list(ex.map(
+                lambda u: _fetch_sync(session, u, validators.get(u, {})),
+                urls,
+            ))
+    else:
+        # feedparser's urllib fetch has no timeout of its own
+        previous_timeout = socket.getdefaulttimeout()
+        socket.setdefaulttimeout(FETCH_TIMEOUT)
+        try:
+            with ThreadPoolExecutor(max_workers=FETCH_WORKERS) as ex:
+                return list(ex.map(
+                    fetch_feed, urls, [validators.get(u) for u in urls]
+                ))
+        finally:
+            socket.setdefaulttimeout(previous_timeout)
+
+    feeds = []
+    for url, res in zip(urls, results):
+        if isinstance(res, Exception):
+            print(f"[WARN] feed error {url}: {type(res).__name__}: {res}")
+            feeds.append({"entries": []})
+            continue
+        body, headers = res
+        if body is None:
+            feeds.append({"status": 304, "entries": []})
+            continue
+        feeds.append(parse_feed(url, body, headers))
+    return feeds
+
+
+def strip_html(html: str) -> str:
+    """
+    Text of an HTML fragment: script/style/iframe/noscript elements are
+    dropped with their content, then every other tag is removed. Each
+    element's closing tag is searched for forwards from its opening tag
+    and the scan carries on after it, so no stretch is rescanned and
+    the whole summary can be cleaned however large its markup is.
+    """
+    kept = []
+    pos = 0
+    unclosed = set()  # names with no closing tag left to find
+    while True:
+        m = _HTML_BLOCK_OPEN_RE.search(html, pos)
+        if m is None:
+            break
+        name = m.group(1).lower()
+        close = None
+        if name not in unclosed:
+            for c in _HTML_BLOCK_CLOSE_RE.finditer(html, m.end()):
+                if c.group(1).lower() == name:
+                    close = c
+                    break
+        if close is None:
+            # left for _HTML_TAG_RE, as an unclosed element isn't a block
+            unclosed.add(name)
+            kept.append(html[pos:m.end()])
+            pos = m.end()
+            continue
+        kept.append(html[pos:m.start()])
+        pos = close.end()
+    kept.append(html[pos:])
+    return _HTML_TAG_RE.sub("", "".join(kept))
+
+
+def entry_to_item(entry, src: int, keywords: list):
     title = entry.get("title", "") or ""
     summary = entry.get("summary", "") or entry.get("description", "") or ""
     link = entry.get("link", "") or ""
     published = entry.get("published", "") or entry.get("updated", "")
     published_parsed = entry.get("published_parsed") or entry.get("updated_parsed")
 
-    # ISO date fallback
+    # ISO date fallback (feedparser's parsed dates are already UTC);
+    # same string as datetime(...).isoformat() without building one
     if published_parsed:
-        dt = datetime(*published_parsed[:6], tzinfo=timezone.utc)
-        iso = dt.isoformat()
+        iso = "%04d-%02d-%02dT%02d:%02d:%02d+00:00" % published_parsed[:6]
     else:
         iso = ""
 
-    clean_summary = re.sub(r"<.*?>", "", summary)[:1000]
+    # most summaries are plain text; only strip if there's markup, and
+    # cap the text only once it's stripped
+    if "<" in summary:
+        summary = strip_html(summary)
+    clean_summary = summary[:1000]
 
-    haystack = f"{title}\n{clean_summary}"
+    haystack = item_text_lower(title, clean_summary)
     matched = matches_keywords(haystack, keywords)
 
     item = {
         "title": title,
         "summary": clean_summary,
         "link": link,
-        "source": source_url,
+        "src": src,  # index into the payload's "sources"
         "published": iso,
         "matched": matched,
         # Will fill these later if transformers is available
         "ai_summary": "",
         "ai_tags": [],
+        # internal, removed before writing
+        "_lower": haystack,
     }
     return item
 
 
+def link_key(link: str) -> str:
+    """
+    Identify a story across feeds by host, path and query, ignoring
+    scheme, fragment, host case and a trailing slash.
+    """
+    if not link:
+        return ""
+    parts = urlparse(link.strip())
+    key = parts.netloc.lower() + parts.path.rstrip("/")
+    if parts.query:
+        key += "?" + parts.query
+    return key
+
+
+def dedupe_items(items: list) -> list:
+    """Drop repeats of the same link, keeping the first seen."""
+    seen = set()
+    unique = []
+    for item in items:
+        key = link_key(item.get("link", ""))
+        if key:
+            if key in seen:
+                continue
+            seen.add(key)
+        unique.append(item)
+    return unique
+
+
 def scrape_html(url: str, keywords: list):
     try:
         r = requests.get(
             url,
             timeout=10,
-            headers={"User-Agent": "IndustrialStrategyBot/0.1"},
+            headers={"User-Agent": USER_AGENT},
         )
         r.raise_for_status()
-        soup = BeautifulSoup(r.text, "html.parser")
+        soup = BeautifulSoup(r.text, BS_PARSER)
         title = soup.title.text.strip() if soup.title else url
         ps = " ".join(
             [p.get_text(" ", strip=True) for p in soup.find_all("p")]
         )[:1500]
         text = f"{title}\n{ps}"
-        matched = matches_keywords(text, keywords)
+        matched = matches_keywords(norm(text), keywords)
         return title, ps, matched
     except Exception as e:
         print(f"[WARN] html scrape fail {url}: {e}")
         return None, None, []
 
 
-def xml_escape(s: str) -> str:
-    return (s or "").replace("&", "&amp;") \
-                    .replace("<", "&lt;") \
-                    .replace(">", "&gt;") \
-                    .replace('"', "&quot;")
+def xml_text(s: str) -> str:
+    """Element text, minus characters that would make the XML invalid."""
+    return _XML_INVALID_RE.sub("", s or "")
+
+
+def build_rss(items: list, generated_at: str) -> bytes:
+    """A simple RSS 2.0 feed; escaping is left to the serialiser."""
+    rss = ET.Element("rss", version="2.0")
+    channel = ET.SubElement(rss, "channel")
+    ET.SubElement(channel, "title").text = "Industrial Strategy Tracker"
+    ET.SubElement(channel, "link").text = SITE_URL
+    ET.SubElement(channel, "description").text = (
+        "Updates from government and industry sources."
+    )
+    ET.SubElement(channel, "lastBuildDate").text = generated_at
+
+    for item in items:
+        node = ET.SubElement(channel, "item")
+        ET.SubElement(node, "title").text = xml_text(item.get("title"))
+        ET.SubElement(node, "link").text = xml_text(item.get("link"))
+        ET.SubElement(node, "description").text = xml_text(
+            item.get("ai_summary") or item.get("summary")
+        )
+        ET.SubElement(node, "pubDate").text = (
+            item.get("published") or generated_at
+        )
+
+    if HAVE_LXML:
+        return ET.tostring(
+            rss, encoding="UTF-8", xml_declaration=True, pretty_print=True
+        )
+    ET.indent(rss)
+    return ET.tostring(rss, encoding="UTF-8", xml_declaration=True)
+
+
+def get_tag_automaton():
+    """
+    Lazy init for an Aho-Corasick automaton over _AI_TAG_MAP, so the
+    tag list can grow without adding passes over the text.
+    Returns None without pyahocorasick.
+    """
+    global _TAG_AUTOMATON
+    if not HAVE_AHOCORASICK:
+        return None
+    if _TAG_AUTOMATON is None:
+        automaton = ahocorasick.Automaton()
+        for substr, label in _AI_TAG_MAP.items():
+            automaton.add_word(substr, label)
+        automaton.make_automaton()
+        _TAG_AUTOMATON = automaton
+    return _TAG_AUTOMATON
 
 
-def infer_ai_tags(text: str) -> list:
+def infer_ai_tags(text_lower: str) -> list:
     """
     Cheap tag inference on top of the keyword logic.
-    No heavy model here, just heuristics.
+    No heavy model here, just heuristics. Expects lowercased text.
     """
-    t = text.lower()
-    tags = set()
-
-    def add_if(substr, label):
-        if substr in t:
-            tags.add(label)
-
-    add_if("hydrogen", "Hydrogen")
-    add_if("fuel cell", "Fuel cells")
-    add_if("net zero", "Net zero")
-    add_if("decarbonis", "Decarbonisation")
-    add_if("industrial strategy", "Industrial strategy")
-    add_if("manufactur", "Manufacturing")
-    add_if("supply chain", "Supply chains")
-    add_if("semiconductor", "Semiconductors")
-    add_if("chips act", "CHIPS / semiconductors")
-    add_if("ira ", "US IRA")
-    add_if("r&d", "R&D")
-    add_if("research and development", "R&D")
-    add_if("innovation", "Innovation")
-    add_if("clean energy", "Clean energy")
-    add_if("heat pump", "Heat pumps")
-    add_if("nuclear", "Nuclear")
-    add_if("small modular reactor", "SMRs")
-    add_if("trade", "Trade")
-    add_if("export", "Trade")
-
-    return sorted(tags)
-
-
-def add_ai_fields(items: list):
+    automaton = get_tag_automaton()
+    if automaton is not None:
+        return sorted({label for _, label in automaton.iter(text_lower)})
+    return sorted({
+        label for substr, label in _AI_TAG_MAP.items() if substr in text_lower
+    })
+
+
+def _finish_items(items: list) -> list:
+    for item in items:
+        # heuristic tags on top; _lower isn't needed after this
+        item["ai_tags"] = infer_ai_tags(item.pop("_lower"))
+    return items
+
+
+def enrich_iter(items: list):
     """
     Add ai_summary and ai_tags for each item if transformers is available.
     To keep runtime sensible we cap the number of items we summarise.
+    Yields runs of finished items, in order, as each summariser batch
+    completes, so they can be written out while the next batch runs.
     """
     summariser = get_summarizer()
     if summariser is None:
         print("[INFO] transformers not available, skipping AI summaries.")
         # Still add heuristic tags
-        for item in items:
-            text = f"{item.get('title','')} {item.get('summary','')}"
-            item["ai_tags"] = infer_ai_tags(text)
+        if items:
+            yield _finish_items(items)
         return
 
     max_items = 50  # summarise only the most recent 50 to keep things light
-    for idx, item in enumerate(items):
+    todo = []
+    for idx, item in enumerate(items[:max_items]):
+        if item.get("ai_summary"):
+            # reused from the last run (feed unchanged), already summarised
+            continue
         text = f"{item.get('title','')}. {item.get('summary','')}".strip()
         text = text.replace("\n", " ")
         if not text or len(text) < 40:
             item["ai_summary"] = ""
         else:
-            try:
-                # keep input short for speed
-                input_text = text[:900]
-                out = summariser(
-                    input_text,
-                    max_length=50,
-                    min_length=8,
-                    do_sample=False,
-                )
-                summary_text = out[0]["summary_text"].strip()
-                item["ai_summary"] = summary_text
-            except Exception as e:
-                print(f"[WARN] summarisation failed for item {idx}: {e}")
-                item["ai_summary"] = ""
-
-        # heuristic tags on top
-        text_for_tags = f"{item.get('title','')} {item.get('summary','')}"
-        item["ai_tags"] = infer_ai_tags(text_for_tags)
-
-        if idx + 1 >= max_items:
-            # For older items, just tags, no summaries
-            break
-
-    # For remaining items (beyond max_items), at least add tags
-    for item in items[max_items:]:
-        text_for_tags = f"{item.get('title','')} {item.get('summary','')}"
-        item["ai_tags"] = infer_ai_tags(text_for_tags)
+            # keep input short for speed
+            todo.append((idx, item, text[:900]))
+
+    # One pipeline call per batch rather than per item
+    done = 0
+    for start in range(0, len(todo), SUMMARY_BATCH_SIZE):
+        batch = todo[start:start + SUMMARY_BATCH_SIZE]
+        try:
+            outs = summariser(
+                [text for _, _, text in batch],
+                batch_size=SUMMARY_BATCH_SIZE,
+                max_length=50,
+                min_length=8,
+                do_sample=False,
+                truncation=True,
+            )
+        except Exception as e:
+            print(
+                f"[WARN] summarisation failed for items "
+                f"{batch[0][0]}-{batch[-1][0]}: {e}"
+            )
+            outs = [{"summary_text": ""}] * len(batch)
+        for (_, item, _), out in zip(batch, outs):
+            item["ai_summary"] = out["summary_text"].strip()
+        # everything up to the end of this batch is now final
+        upto = batch[-1][0] + 1
+        yield _finish_items(items[done:upto])
+        done = upto
+
+    if done < len(items):
+        yield _finish_items(items[done:])
 
 
 def main():
@@ -228,16 +827,51 @@ def main():
     html_sources = cfg.get("html_sources", []) if USE_HTML_SCRAPING else []
 
     items = []
+    get_keyword_matcher(keywords)  # normalise keywords once, up front
 
     # --- RSS / Atom feeds ---
-    for url in sources:
-        url = (url or "").strip()
-        if not url:
+    # a feed listed twice would otherwise have its items added twice
+    urls = list(dict.fromkeys(u.strip() for u in sources if u and u.strip()))
+    # Only ask for a 304 when we still have that feed's items to reuse.
+    # They're kept per feed, before dedupe: news.json only holds the
+    # first feed's copy of a shared story, which may since have gone.
+    feed_cache = load_feed_cache()
+    validators = {
+        u: {"etag": feed_cache[u].get("etag"),
+            "modified": feed_cache[u].get("modified")}
+        for u in urls if feed_cache.get(u, {}).get("items")
+    }
+    feeds = fetch_feeds(urls, validators)
+    new_validators = {}
+    feed_items = {}  # url -> that feed's items, before dedupe
+    # Items name their feed by position in this (url -> index) mapping,
+    # written out once as "sources" instead of repeating every URL
+    src_index = {}
+    for url in urls:
+        src_index.setdefault(url, len(src_index))
+    for url, feed in zip(urls, feeds):
+        if feed.get("status") == 304:
+            new_validators[url] = validators[url]
+            feed_items[url] = feed_cache[url]["items"]
+            for item in feed_items[url]:
+                item["src"] = src_index[url]
+                item["_lower"] = item_text_lower(
+                    item.get("title", ""), item.get("summary", "")
+                )
+                # keywords may have changed since the item was written
+                item["matched"] = matches_keywords(item["_lower"], keywords)
+            items.extend(feed_items[url])
             continue
-        feed = fetch_feed(url)
-        for entry in feed.get("entries", []):
-            item = entry_to_item(entry, url, keywords)
-            items.append(item)
+        if feed.get("etag") or feed.get("modified"):
+            new_validators[url] = {
+                "etag": feed.get("etag"),
+                "modified": feed.get("modified"),
+            }
+        feed_items[url] = [
+            entry_to_item(entry, src_index[url], keywords)
+            for entry in feed.get("entries", [])
+        ]
+        items.extend(feed_items[url])
 
     # --- Optional HTML scraping (off by default) ---
     if USE_HTML_SCRAPING:
@@ -253,68 +887,47 @@ def main():
                 "title": title or url,
                 "summary": text,
                 "link": url,
-                "source": url,
+                "src": src_index.setdefault(url, len(src_index)),
                 "published": "",
                 "matched": matched,
                 "ai_summary": "",
                 "ai_tags": [],
+                "_lower": item_text_lower(title or url, text),
             })
 
-    # Sort newest first (blank published dates go last)
-    items.sort(key=lambda x: x.get("published") or "", reverse=True)
+    # Feeds syndicate the same stories; don't summarise them twice
+    items = dedupe_items(items)
 
-    # Add AI enrichments
-    add_ai_fields(items)
+    # Sort newest first (blank published dates go last); every item
+    # carries a "published" string, "" when the feed gave no date
+    items.sort(key=itemgetter("published"), reverse=True)
 
     os.makedirs("data", exist_ok=True)
     generated_at = datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
 
-    payload = {
+    header = {
         "generated_at": generated_at,
         "keywords": keywords,
+        "sources": list(src_index),
         "count": len(items),
-        "items": items,
     }
 
-    # Write JSON for the web app
-    with open(DATA_OUT, "w", encoding="utf-8") as f:
-        json.dump(payload, f, ensure_ascii=False, indent=2)
+    # Add AI enrichments and write JSON for the web app as they finish
+    stream_json(DATA_OUT, header, enrich_iter(items))
 
     # Also write a simple RSS feed (top 50 items)
-    rss_items = []
-    for item in items[:50]:
-        title = xml_escape(item.get("title", ""))
-        link = xml_escape(item.get("link", ""))
-        description = xml_escape(
-            item.get("ai_summary") or item.get("summary") or ""
-        )
-        pubdate = item.get("published") or generated_at
-        rss_items.append(
-            f"""
-    <item>
-      <title>{title}</title>
-      <link>{link}</link>
-      <description>{description}</description>
-      <pubDate>{xml_escape(pubdate)}</pubDate>
-    </item>"""
-        )
+    write_atomic(RSS_OUT, build_rss(items[:50], generated_at))
+
+    # Only remember validators once the items they stand for are written.
+    # Items dedupe kept were enriched in place, so their ai_summary is
+    # reused on a 304 too.
+    new_feed_cache = {
+        url: {**v, "items": [cached_item(item) for item in feed_items[url]]}
+        for url, v in new_validators.items()
+    }
+    write_atomic(FEED_CACHE, dump_json(new_feed_cache))
 
-    rss = f"""<?xml version="1.0" encoding="UTF-8"?>
-<rss version="2.0">
-  <channel>
-    <title>Industrial Strategy Tracker</title>
-    <link>https://industrialstrategy.github.io/industrialstrategy/</link>
-    <description>Updates from government and industry sources.</description>
-    <lastBuildDate>{xml_escape(generated_at)}</lastBuildDate>
-    {''.join(rss_items)}
-  </channel>
-</rss>
-"""
-
-    with open("data/feed.xml", "w", encoding="utf-8") as f_rss:
-        f_rss.write(rss)
-
-    print(f"[OK] Wrote {DATA_OUT} with {len(items)} items and data/feed.xml")
+    print(f"[OK] Wrote {DATA_OUT} with {len(items)} items and {RSS_OUT}")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,105 @@
+import json
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import scraper  # noqa: E402
+
+
+def test_summary_drops_script_and_style_content():
+    entry = {
+        "title": "Update",
+        "summary": (
+            "Net zero <script>var x=1;</script>"
+            "<STYLE type=\"text/css\">.a{color:red}</STYLE >"
+            "<iframe src=\"x\">frame</iframe><noscript>enable js</noscript>"
+            "manufacturing <b>supply</b> chain"
+        ),
+    }
+    item = scraper.entry_to_item(entry, 0, [])
+    assert item["summary"] == "Net zero manufacturing supply chain"
+
+
+def test_summary_strips_markup_past_the_first_10k_characters():
+    image = '<img src="data:image/png;base64,' + "A" * 20000 + '">'
+    item = scraper.entry_to_item({"summary": image + "Steel output"}, 0, [])
+    assert item["summary"] == "Steel output"
+
+    css = "<style>" + ".a{color:red}" * 2000 + "</style>"
+    item = scraper.entry_to_item({"summary": css + "Steel output"}, 0, [])
+    assert item["summary"] == "Steel output"
+
+
+def _run(tmp_path, monkeypatch, urls, feeds):
+    """Run main() in tmp_path with the given fetch results; return titles."""
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "config.json").write_text(
+        json.dumps({"keywords": [], "rss_sources": urls})
+    )
+    monkeypatch.setattr(scraper, "CONFIG_PATH", "config.json")
+    monkeypatch.setattr(scraper, "get_summarizer", lambda: None)
+    sent = {}
+
+    def fetch_feeds(urls, validators=None):
+        sent.update(validators or {})
+        return [feeds[u] for u in urls]
+
+    monkeypatch.setattr(scraper, "fetch_feeds", fetch_feeds)
+    scraper.main()
+    with open(scraper.DATA_OUT, encoding="utf-8") as f:
+        payload = json.load(f)
+    return sorted(item["title"] for item in payload["items"]), sent
+
+
+def _feed(etag, *titles, link=True):
+    return {
+        "etag": etag,
+        "entries": [
+            {"title": t, "link": f"https://example.com/{t}" if link else ""}
+            for t in titles
+        ],
+    }
+
+
+def test_feed_listed_twice_is_fetched_once(tmp_path, monkeypatch):
+    url = "https://a.example/feed"
+    titles, _ = _run(
+        tmp_path, monkeypatch, [url, url], {url: _feed("a1", "X", link=False)}
+    )
+    assert titles == ["X"]
+    titles, sent = _run(
+        tmp_path, monkeypatch, [url, url], {url: {"status": 304, "entries": []}}
+    )
+    assert url in sent
+    assert titles == ["X"]
+
+
+def test_stream_json_removes_tmp_on_failure(tmp_path):
+    path = str(tmp_path / "out.json")
+
+    def runs():
+        yield [{"a": 1}]
+        raise RuntimeError("boom")
+
+    with pytest.raises(RuntimeError):
+        scraper.stream_json(path, {"count": 1}, runs())
+    assert os.listdir(tmp_path) == []
+
+
+def test_304_feed_keeps_story_deduped_into_another_feed(tmp_path, monkeypatch):
+    a, b = "https://a.example/feed", "https://b.example/feed"
+    titles, _ = _run(
+        tmp_path, monkeypatch, [a, b],
+        {a: _feed("a1", "X", "Y"), b: _feed("b1", "X", "Z")},
+    )
+    assert titles == ["X", "Y", "Z"]
+    # A drops X; B is unchanged and still carries it
+    titles, sent = _run(
+        tmp_path, monkeypatch, [a, b],
+        {a: _feed("a2", "Y"), b: {"status": 304, "entries": []}},
+    )
+    assert sent[b]["etag"] == "b1"
+    assert titles == ["X", "Y", "Z"]